@@ -11,10 +11,13 @@ __copyright__ = "Copyright 2018, Alistair Galbraith"
 
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import websocket
 import threading
 import json
-import datetime
+import random
+import socket
+import time
 
 from typing import Any, Callable, Dict, Type
 
@@ -22,8 +25,50 @@ from pynoon.const import (
     LOGIN_URL, RENEW_TOKEN_URL, DEX_URL
 )
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_SHARED_SESSION = None
+
+# Shared empty tuple, so absent-list fast paths never allocate
+_EMPTY = ()
+
+# GraphQL document posted by discoverDevices, pre-encoded so every discovery
+# hands the same bytes buffer straight to the transport
+_DISCOVER_QUERY = b"{spaces {guid name lightsOn activeScene{guid name} lines{guid lineState displayName dimmingLevel multiwayMaster { guid }} scenes{name guid}}}"
+
+
+class _KeepaliveAdapter(HTTPAdapter):
+    """HTTPAdapter that disables Nagle and enables TCP keepalive on pooled
+    connections, so a controller that sits idle for hours doesn't stall on a
+    silently-dropped connection when the next control call arrives."""
+
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30))
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _sharedSession():
+    """Returns the pooled session shared by all Noon instances, so repeated
+    control calls reuse established TLS connections to Noon's API hosts."""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        _SHARED_SESSION = requests.Session()
+        _SHARED_SESSION.mount("https://", _KeepaliveAdapter(pool_connections=4, pool_maxsize=8))
+    return _SHARED_SESSION
+
 _LOGGER = logging.getLogger(__name__)
-logging.basicConfig(level=logging.DEBUG, format='%(message)s')
 
 NoonEventHandler = Callable[['NoonEntity', Any, 'NoonEvent', Dict], None]
 
@@ -65,12 +110,23 @@ class NoonEvent(object):
 
 class NoonEntity(object):
 
+    __slots__ = ('_noon', '_name', '_guid', '_subscribers')
+
+    _SETTABLE = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        """Precomputes the settable property names for each entity class at
+        class-creation time, so _handle_change never walks the class dict."""
+        super().__init_subclass__(**kwargs)
+        cls._SETTABLE = frozenset(attr for attr, value in vars(cls).items()
+                                  if isinstance(value, property) and value.fset is not None)
+
     def __init__(self, noon, guid, name):
         """Initializes the base class with common, basic data."""
         self._noon = noon
         self._name = name
         self._guid = guid
-        self._subscribers = []
+        self._subscribers = ()
         noon._registerEntity(self)
 
     @property 
@@ -85,9 +141,15 @@ class NoonEntity(object):
 
     def _dispatch_event(self, event: NoonEvent, params: Dict):
         """Dispatches the specified event to all the subscribers."""
-        _LOGGER.debug("Sending notifications!")
-        for handler, context in self._subscribers:
-            _LOGGER.debug("...notification sent.")
+        subscribers = self._subscribers
+        if not subscribers:
+            return
+        debugEnabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debugEnabled:
+            _LOGGER.debug("Sending notifications!")
+        for handler, context in subscribers:
+            if debugEnabled:
+                _LOGGER.debug("...notification sent.")
             handler(self, context, event, params)
 
     def subscribe(self, handler: NoonEventHandler, context):
@@ -99,9 +161,22 @@ class NoonEntity(object):
                 params: a dict of event-specific parameters
         context: User-supplied, opaque object that will be passed to handler.
         """
-        _LOGGER.debug("Added update subscriber for {}".format(self.name))
-        self._subscribers.append((handler, context))
+        _LOGGER.debug("Added update subscriber for %s", self.name)
+        self._subscribers = self._subscribers + ((handler, context),)
     
+    def apply_changes(self, changes: Dict):
+        """Applies a batch of field updates in a single pass. Fields without
+        a matching settable property are ignored; each property that does
+        change still fires its own event, so existing subscribers see the
+        same event types as before."""
+        settable = type(self)._SETTABLE
+        for key, value in changes.items():
+            if key in settable:
+                _LOGGER.debug("...setting %s = %s", key, value)
+                setattr(self, key, value)
+            else:
+                _LOGGER.debug("...ignoring %s = %s", key, value)
+
     def handle_update(self, args):
         """The handle_update callback is invoked when an event is received
         for the this entity.
@@ -119,6 +194,8 @@ class NoonEntity(object):
 
 class NoonSpace(NoonEntity):
 
+    __slots__ = ('_activeScene', '_lightsOn', '_lines', '_scenes', '_scenesByName')
+
     class Event(NoonEvent):
         """Output events that can be generated.
         SCENE_CHANGED: The scene has changed.
@@ -142,7 +219,7 @@ class NoonSpace(NoonEntity):
     def lightsOn(self, value):
         valueChanged = (self._lightsOn != value)
         self._lightsOn = value
-        if valueChanged:
+        if valueChanged and self._subscribers:
             self._dispatch_event(NoonSpace.Event.LIGHTSON_CHANGED, {'lightsOn': self._lightsOn})
 
     @property
@@ -164,22 +241,22 @@ class NoonSpace(NoonEntity):
 
         """ This may be a dict object - {"guid": "some-guid-value-here"} """
         actualValue = value
-        if isinstance(actualValue, Dict) and actualValue.get("guid", None) is not None:
+        if isinstance(actualValue, dict) and actualValue.get("guid", None) is not None:
             actualValue = actualValue.get("guid")
 
         """ Sanity check - we should have a scene for this """
         newScene = self._scenes.get(actualValue, None)
         if newScene is None:
             if actualValue is not None:
-                _LOGGER.error("Space changed to new scene '{}', but this scene is unknown!".format(actualValue))
+                _LOGGER.error("Space changed to new scene '%s', but this scene is unknown!", actualValue)
             return
 
         """ Debug """
-        _LOGGER.info("Scene for space '{}' changed to '{}'".format(self.name, newScene.name))
+        _LOGGER.info("Scene for space '%s' changed to '%s'", self.name, newScene.name)
 
         valueChanged = (self._activeScene != actualValue)
         self._activeScene = actualValue
-        if valueChanged:
+        if valueChanged and self._subscribers:
             self._dispatch_event(NoonSpace.Event.SCENE_CHANGED, {'sceneId': self._activeScene})
 
     def setSceneActive(self, active=None, sceneIdOrName=None):
@@ -196,20 +273,19 @@ class NoonSpace(NoonEntity):
         """ Get the scene """
         targetScene = self._scenes.get(sceneIdOrName, None)
         if targetScene is None:
-            for id, scene in self._scenes.items():
-                if scene.name == sceneIdOrName:
-                    targetScene = scene
-        
+            targetScene = self._scenesByName.get(sceneIdOrName, None)
+
+
         """ Sanity Check """
         if targetScene is None:
-            _LOGGER.error("Did not find scene in space '{}' with name or ID {}".format(self.name, sceneIdOrName))
+            _LOGGER.error("Did not find scene in space '%s' with name or ID %s", self.name, sceneIdOrName)
             raise NoonInvalidParametersError
 
         """ Send the command """
-        _LOGGER.debug("Attempting to activate scene {} in space '{}', with active = {}".format(targetScene.name, self.name, active))
-        actionUrl = "{}/api/action/space/scene".format(self._noon.endpoints["action"])
-        result = self._noon.session.post(actionUrl, headers={"Authorization": "Token {}".format(self._noon.authToken)}, json={"space": self.guid, "activeScene": targetScene.guid, "on": active, "tid": 55555})
-        _LOGGER.debug("Got activate scene result: {}".format(result))
+        _LOGGER.debug("Attempting to activate scene %s in space '%s', with active = %s", targetScene.name, self.name, active)
+        actionUrl = self._noon.urls["spaceScene"]
+        result = self._noon.session.post(actionUrl, headers=self._noon.authHeaders, json={"space": self.guid, "activeScene": targetScene.guid, "on": active, "tid": 55555})
+        _LOGGER.debug("Got activate scene result: %s", result)
 
 
     def activateScene(self):
@@ -220,18 +296,21 @@ class NoonSpace(NoonEntity):
 
         self.setSceneActive(active=False)
 
-    def __init__(self, noon, guid, name, activeScene=None, lightsOn=None, lines={}, scenes={}):
-        
+    def __init__(self, noon, guid, name, activeScene=None, lightsOn=None, lines=None, scenes=None):
+
         """Initializes the Space."""
         self._activeScene = None
         self._lightsOn = None
-        self._lines = lines
-        self._scenes = scenes
+        self._lines = lines if lines is not None else {}
+        self._scenes = scenes if scenes is not None else {}
+        self._scenesByName = {scene.name: scene for scene in self._scenes.values()}
         super(NoonSpace, self).__init__(noon, guid, name)
 
         """ Trigger any initial updates """
-        self.activeScene = activeScene
-        self.lightsOn = lightsOn
+        if activeScene is not None:
+            self.activeScene = activeScene
+        if lightsOn is not None:
+            self.lightsOn = lightsOn
 
     def __str__(self):
         """Returns a pretty-printed string for this object."""
@@ -250,7 +329,7 @@ class NoonSpace(NoonEntity):
         if not isinstance(noon, Noon):
             _LOGGER.error("Noon object not correctly passed as a parameter")
             raise NoonInvalidParametersError
-        if not isinstance(json, Dict):
+        if not isinstance(json, dict):
             _LOGGER.error("JSON object must be pre-parsed before loading")
             raise NoonInvalidParametersError
 
@@ -259,22 +338,26 @@ class NoonSpace(NoonEntity):
         name = json.get("name", None)
 
         if guid is None or name is None:
-            _LOGGER.debug("Invalid JSON payload: {}".format(json))
+            _LOGGER.debug("Invalid JSON payload: %s", json)
             raise NoonInvalidJsonError
         newSpace = NoonSpace(noon, guid, name)
 
-        """Scenes"""
+        """Scenes - bind the constructors locally, the loops below run for
+        every child in the discovery payload"""
+        sceneFromJsonObject = NoonScene.fromJsonObject
         scenesMap = {}
-        for scene in json.get("scenes", []):
-            thisScene = NoonScene.fromJsonObject(noon, newSpace, scene)
-            scenesMap[thisScene.guid] = thisScene
+        for scene in json.get("scenes", ()):
+            thisScene = sceneFromJsonObject(noon, newSpace, scene)
+            scenesMap[thisScene._guid] = thisScene
         newSpace._scenes = scenesMap
+        newSpace._scenesByName = {scene._name: scene for scene in scenesMap.values()}
 
         """Lines"""
+        lineFromJsonObject = NoonLine.fromJsonObject
         linesMap = {}
-        for line in json.get("lines", []):
-            thisLine = NoonLine.fromJsonObject(noon, newSpace, line)
-            linesMap[thisLine.guid] = thisLine
+        for line in json.get("lines", ()):
+            thisLine = lineFromJsonObject(noon, newSpace, line)
+            linesMap[thisLine._guid] = thisLine
         newSpace._lines = linesMap
 
         """ Status """
@@ -288,6 +371,8 @@ class NoonSpace(NoonEntity):
 
 class NoonLine(NoonEntity):
 
+    __slots__ = ('_lineState', '_dimmingLevel', '_parentSpace')
+
     class Event(NoonEvent):
         """Output events that can be generated.
         DIM_LEVEL_CHANGED: The dim level of this line has changed.
@@ -311,7 +396,7 @@ class NoonLine(NoonEntity):
 
         valueChanged = (self._lineState != value)
         self._lineState = value
-        if valueChanged:
+        if valueChanged and self._subscribers:
             self._dispatch_event(NoonLine.Event.LINE_STATE_CHANGED, {'lineState': self._lineState})
 
     @property
@@ -325,7 +410,7 @@ class NoonLine(NoonEntity):
     def dimmingLevel(self, value):
         valueChanged = (self._dimmingLevel != value)
         self._dimmingLevel = value
-        if valueChanged:
+        if valueChanged and self._subscribers:
             self._dispatch_event(NoonLine.Event.DIM_LEVEL_CHANGED, {'dimLevel': self._dimmingLevel})
 
     def set_brightness(self, brightnessLevel):
@@ -334,9 +419,9 @@ class NoonLine(NoonEntity):
         self._noon.authenticate()
 
         """ Send the command """
-        actionUrl = "{}/api/action/line/lightLevel".format(self._noon.endpoints["action"])
-        result = self._noon.session.post(actionUrl, headers={"Authorization": "Token {}".format(self._noon.authToken)}, json={"line": self.guid, "lightLevel": brightnessLevel, "tid": 55555})
-        _LOGGER.debug("Got set_brightness result: {}".format(result))
+        actionUrl = self._noon.urls["lineLightLevel"]
+        result = self._noon.session.post(actionUrl, headers=self._noon.authHeaders, json={"line": self.guid, "lightLevel": brightnessLevel, "tid": 55555})
+        _LOGGER.debug("Got set_brightness result: %s", result)
     
 
     def turn_on(self):
@@ -356,26 +441,20 @@ class NoonLine(NoonEntity):
         super(NoonLine, self).__init__(noon, guid, name)
 
         """ Trigger any initial updates """
-        self.lineState = lineState
-        self.dimmingLevel = dimmingLevel
+        if lineState is not None:
+            self.lineState = lineState
+        if dimmingLevel is not None:
+            self.dimmingLevel = dimmingLevel
 
     @classmethod
     def fromJsonObject(cls, noon, space, json):
 
-        """Sanity Check"""
-        if not isinstance(noon, Noon):
-            _LOGGER.error("Noon object not correctly passed as a parameter")
-            raise NoonInvalidParametersError
-        if not isinstance(json, Dict):
-            _LOGGER.error("JSON object must be pre-parsed before loading")
-            raise NoonInvalidParametersError
-
-        """Basics"""
+        """Basics - inputs were validated by the parent space's fromJsonObject"""
         guid = json.get("guid", None)
         name = json.get("displayName", None)
 
         if guid is None or name is None:
-            _LOGGER.debug("Invalid JSON payload: {}".format(json))
+            _LOGGER.debug("Invalid JSON payload: %s", json)
             raise NoonInvalidJsonError
         newLine = NoonLine(noon, space, guid, name)
 
@@ -399,6 +478,8 @@ class NoonLine(NoonEntity):
 
 class NoonScene(NoonEntity):
 
+    __slots__ = ('_parentSpace',)
+
     def __init__(self, noon, space, guid, name):
         
         """Initializes the Space."""
@@ -408,20 +489,12 @@ class NoonScene(NoonEntity):
     @classmethod
     def fromJsonObject(cls, noon, space, json):
 
-        """Sanity Check"""
-        if not isinstance(noon, Noon):
-            _LOGGER.error("Noon object not correctly passed as a parameter")
-            raise NoonInvalidParametersError
-        if not isinstance(json, Dict):
-            _LOGGER.error("JSON object must be pre-parsed before loading")
-            raise NoonInvalidParametersError
-
-        """Basics"""
+        """Basics - inputs were validated by the parent space's fromJsonObject"""
         guid = json.get("guid", None)
         name = json.get("name", None)
 
         if guid is None or name is None:
-            _LOGGER.debug("Invalid JSON payload: {}".format(json))
+            _LOGGER.debug("Invalid JSON payload: %s", json)
             raise NoonInvalidJsonError
         newScene = NoonScene(noon, space, guid, name)
 
@@ -463,31 +536,49 @@ class Noon(object):
         self.__authenticated = False
         self.__loginResponse = None
         self.__token = None
-        self.__tokenValidUntil = datetime.datetime.now()
-        self.__tokenRenewValidUntil = datetime.datetime.now()
-        self.__session = requests.Session()
+        self.__authHeaders = {}
+        self.__tokenValidUntil = 0.0
+        self.__tokenRenewValidUntil = 0.0
+        self.__session = _sharedSession()
         self.__subscribed = False
 
         # Store credentials
         self.__username = username
         self.__password = password
         self.__endpoints = {}
+        self.__urls = {}
 
         # Flag for tracking errors
         self.__errorCount = 0
-        self.__lastConnectAttempt = 0
+        self.__reconnectDelay = 1.0
 
         # External Properties
         self.__spaces = {}
         self.__lines = {}
         self.__scenes = {}
         self.__allEntities = {}
+
+        # Per-type registries for _registerEntity
+        self.__entityBuckets = {
+            NoonSpace: self.__spaces,
+            NoonLine: self.__lines,
+            NoonScene: self.__scenes
+        }
+
+        # Handlers for websocket messages, keyed on the event discriminator
+        self.__eventHandlers = {
+            "notification": self._handle_notification
+        }
         
 
     @property
     def endpoints(self):
         return self.__endpoints
 
+    @property
+    def urls(self):
+        return self.__urls
+
     @property
     def session(self):
         return self.__session
@@ -496,23 +587,28 @@ class Noon(object):
     def authToken(self):
         return self.__token
 
+    @property
+    def authHeaders(self):
+        return self.__authHeaders
+
     def authenticate(self):
 
         """ Do we already have valid tokens? """
-        if self.__token is not None and self.__tokenValidUntil > datetime.datetime.now():
+        now = time.monotonic()
+        if self.__token is not None and self.__tokenValidUntil > now:
             _LOGGER.debug("Using cached token, which should still be valid")
             return
 
         """ Authenticate user, and get tokens """
         _LOGGER.debug("No valid token or token expired. Authenticating...")
-        if(self.__tokenRenewValidUntil > datetime.datetime.now()):
+        if(self.__tokenRenewValidUntil > now):
             url = RENEW_TOKEN_URL
             json = self.__loginResponse
         else:
             url = LOGIN_URL
             json = {"email": self.__username, "password": self.__password}
 
-        result = self.__session.post(url, json=json).json()
+        result = _json_loads(self.__session.post(url, json=json).content)
         if isinstance(result, dict) and result.get("token") is not None:
 
             """ Debug """
@@ -522,28 +618,36 @@ class Noon(object):
             self.authenticated = True
             self.__loginResponse = result
             self.__token = result.get("token")
-            self.__tokenValidUntil = datetime.datetime.now() + datetime.timedelta(seconds = (result.get("lifetime",0)-30))
-            self.__tokenRenewValidUntil = datetime.datetime.now() + datetime.timedelta(seconds = (result.get("renewLifetime",0)-30))
-            _LOGGER.debug("Authenticated. Token expires at {:%H:%M:%S}.".format(self.__tokenValidUntil))
+            self.__authHeaders = {"Authorization": f"Token {self.__token}"}
+            self.__tokenValidUntil = time.monotonic() + (result.get("lifetime", 0) - 30)
+            self.__tokenRenewValidUntil = time.monotonic() + (result.get("renewLifetime", 0) - 30)
+            _LOGGER.debug("Authenticated. Token expires in %s seconds.", result.get("lifetime", 0))
             
             """ Get endpoints if needed """
             if len(self.__endpoints) == 0:
-                self._refreshEndpoints
-
-            self._refreshEndpoints()
+                self._refreshEndpoints()
         else:
-            _LOGGER.debug("Response: {}".format(result))
+            _LOGGER.debug("Response: %s", result)
             raise NoonAuthenticationError
 
     def _refreshEndpoints(self):
 
         """ Update the noon endpoints for this account """
         _LOGGER.debug("Refreshing endpoints...")
-        result = self.__session.get(DEX_URL, headers={"Authorization": "Token {}".format(self.__token)}).json()
+        result = _json_loads(self.__session.get(DEX_URL, headers=self.__authHeaders).content)
         if isinstance(result, dict) and isinstance(result.get("endpoints"), dict):
             self.__endpoints = result.get("endpoints")
+
+            """ Precompose the URLs built from these endpoints, so the
+            per-call and per-connect paths don't reformat them """
+            self.__urls = {
+                "spaceScene": "{}/api/action/space/scene".format(self.__endpoints["action"]),
+                "lineLightLevel": "{}/api/action/line/lightLevel".format(self.__endpoints["action"]),
+                "query": "{}/api/query".format(self.__endpoints["query"]),
+                "notifications": "{}/api/notifications".format(self.__endpoints["notification-ws"])
+            }
         else:
-            _LOGGER.debug("Response: {}".format(result))
+            _LOGGER.debug("Response: %s", result)
             raise NoonAuthenticationError
 
     def _registerEntity(self, entity: NoonEntity):
@@ -551,44 +655,12 @@ class Noon(object):
         """ EVERYTHING """
         self.__allEntities[entity.guid] = entity
 
-        """ SPACE """
-        if isinstance(entity, NoonSpace):
-            existingEntity = self.__spaces.get(entity.guid, None)
-            if existingEntity is not None:
-                if entity.name != existingEntity.name and False:
-                    _LOGGER.error("New space '{}' has same ID as existing space '{}'".format(entity.name, existingEntity.name))
-                    raise NoonDuplicateIdError
-                else:
-                    return
-            else:
-                self.__spaces[entity.guid] = entity	
-
-        """ LINE """
-        if isinstance(entity, NoonLine):
-            existingEntity = self.__lines.get(entity.guid, None)
-            if existingEntity is not None:
-                if entity.name != existingEntity.name and False:
-                    _LOGGER.error("New line '{}' has same ID as existing line '{}'".format(entity.name, existingEntity.name))
-                    raise NoonDuplicateIdError
-                else:
-                    return
-            else:
-                self.__lines[entity.guid] = entity	
-
-        """ SCENE """
-        if isinstance(entity, NoonScene):
-            existingEntity = self.__scenes.get(entity.guid, None)
-            if existingEntity is not None:
-                if entity.name != existingEntity.name and False:
-                    _LOGGER.error("New scene '{}' has same ID as existing scene '{}'".format(entity.name, existingEntity.name))
-                    raise NoonDuplicateIdError
-                else:
-                    return
-            else:
-                self.__scenes[entity.guid] = entity			
+        """ Type-specific registry """
+        bucket = self.__entityBuckets.get(type(entity), None)
+        if bucket is not None:
+            bucket.setdefault(entity.guid, entity)
+
 
-        
-    
     def discoverDevices(self):
 
         """ (Re)authenticate if needed """
@@ -596,21 +668,25 @@ class Noon(object):
 
         """ Get the device details for this account """
         _LOGGER.debug("Refreshing devices...")
-        queryUrl = "{}/api/query".format(self.__endpoints["query"])
-        result = self.__session.post(queryUrl, headers={"Authorization": "Token {}".format(self.__token), "Content-Type":"application/graphql"}, data="{spaces {guid name lightsOn activeScene{guid name} lines{guid lineState displayName dimmingLevel multiwayMaster { guid }} scenes{name guid}}}").json()
-        if isinstance(result, dict) and isinstance(result.get("spaces"), list):
-            for space in result.get("spaces"):
+        queryUrl = self.__urls["query"]
+        result = _json_loads(self.__session.post(queryUrl, headers={**self.__authHeaders, "Content-Type": "application/graphql"}, data=_DISCOVER_QUERY).content)
+        spaces = result.get("spaces") if isinstance(result, dict) else None
+        if isinstance(spaces, list):
+
+            """ Drop each parsed subtree as soon as its entities exist, so the
+            full JSON tree and the entity graph never coexist in memory """
+            result = None
+            while spaces:
 
                 # Create the space
-                thisSpace = NoonSpace.fromJsonObject(self, space)
+                thisSpace = NoonSpace.fromJsonObject(self, spaces.pop())
 
                 # Debug
-                _LOGGER.debug("Discovered space '{}'".format(thisSpace.name))
-                
+                _LOGGER.debug("Discovered space '%s'", thisSpace.name)
 
         else:
             _LOGGER.error("Invalid device discovery response from Noon")
-            _LOGGER.warn("Response: {}".format(result))
+            _LOGGER.warning("Response: %s", result)
 
 
     def connect(self):
@@ -630,114 +706,125 @@ class Noon(object):
 
     def _thread_event_function(self):
         self.__subscribed = True
-        self.__lastConnectAttempt = datetime.datetime.now()
-        websocket.enableTrace(False)
-        eventStreamUrl = "{}/api/notifications".format(self.__endpoints["notification-ws"])
-        self.__websocket = websocket.WebSocketApp(eventStreamUrl, 
-                header = {
-                    "Authorization": "Token {}".format(self.__token)
-                },
-                on_message = _on_websocket_message, 
-                on_error = _on_websocket_error, 
-                on_close = _on_websocket_close)
-        self.__websocket.on_open = _on_websocket_open
-        self.__websocket.parent = self
-        self.__websocket.run_forever(ping_interval=30)
+        eventStreamUrl = self.__urls["notifications"]
+        self.__websocket = websocket.WebSocketApp(eventStreamUrl,
+                header = self.__authHeaders,
+                on_open = self._websocket_connected,
+                on_message = self._websocket_message,
+                on_error = self._websocket_error,
+                on_close = self._websocket_disconnected)
+        self.__websocket.run_forever(ping_interval=30, skip_utf8_validation=True)
 
         return True
 
+    def _handle_notification(self, data):
+
+        """ State change notification """
+        changes = data["changes"] if "changes" in data else _EMPTY
+        handleChange = self._handle_change
+        for change in self._coalesce_changes(changes):
+            handleChange(change)
+
+    def _coalesce_changes(self, changes):
+        """Merges a burst of change summaries so each entity is touched once.
+        Later values for the same field win, so a frame that flips twenty
+        lines (e.g. a scene change) dispatches one update per entity instead
+        of one per raw change."""
+        merged = {}
+        passthrough = []
+        for change in changes:
+            guid = change.get("guid", None)
+            if guid is None:
+                passthrough.append(change)
+                continue
+            existing = merged.get(guid, None)
+            if existing is None:
+                merged[guid] = change
+            else:
+                fields = {field.get("name"): field for field in existing.get("fields", [])}
+                for field in change.get("fields", []):
+                    fields[field.get("name")] = field
+                existing["fields"] = list(fields.values())
+        if passthrough:
+            return list(merged.values()) + passthrough
+        return merged.values()
+
     def _handle_change(self, changeSummary):
 
         guid = changeSummary.get("guid", None)
         if guid is None:
-            _LOGGER.error("Cannot process change - no GUID in {}".format(changeSummary))
+            _LOGGER.error("Cannot process change - no GUID in %s", changeSummary)
             return
 
         affectedEntity = self.__allEntities.get(guid, None)
         if affectedEntity is None:
-            _LOGGER.debug("UNEXPECTED: Got change notification for {}, but not an expected entity! ({}".format(guid, changeSummary))
+            _LOGGER.debug("UNEXPECTED: Got change notification for %s, but not an expected entity! (%s", guid, changeSummary)
             return
 
-        _LOGGER.debug("Got change notification for '{}' - {}".format(affectedEntity.name, changeSummary))
-        changedFields = changeSummary.get("fields", [])
-        writeableFields = [attr for attr, value in vars(affectedEntity.__class__).items()
-                 if isinstance(value, property) and value.fset is not None]
-        _LOGGER.debug("Settable fields for this entity - {}".format(writeableFields))
-        for changedField in changedFields:
-            key = changedField.get("name")
-            value = changedField.get("value")
-            if key in writeableFields:
-                _LOGGER.debug("...setting {} = {}".format(key, value))
-                setattr(affectedEntity, key, value)
-            else:
-                _LOGGER.debug("...ignoring {} = {}".format(key, value))
+        _LOGGER.debug("Got change notification for '%s' - %s", affectedEntity.name, changeSummary)
+        changedFields = changeSummary.get("fields", _EMPTY)
+        affectedEntity.apply_changes({field.get("name"): field.get("value") for field in changedFields})
             
 
-    def _websocket_connected(self):
+    def _websocket_connected(self, ws):
 
+        _LOGGER.debug("Websocket: Opened")
         _LOGGER.debug("Successful connection. Resetting error timers.")
         self.__errorCount = 0
+        self.__reconnectDelay = 1.0
+
+
+    def _websocket_error(self, ws, error):
 
+        _LOGGER.error("Websocket: Error - %s", error)
 
-    def _websocket_disconnected(self):
+
+    def _websocket_disconnected(self, ws, closeStatusCode=None, closeMessage=None):
+
+        _LOGGER.error("Websocket: Closed")
 
         """ Flag disconnected """
         self.__subscribed = False
 
-        """ Look at our failure time. If it's within the last 30 seconds, we'll abort rather than spam Noon's servers """
-        if self.__lastConnectAttempt < (datetime.datetime.now() - datetime.timedelta(seconds = 30)):
-            _LOGGER.error("Failed to open websocket connection on first attempt. Giving up.")
-            raise NoonException
-        else:
-            self.connect()
+        """ Reconnect from a fresh thread, so the close callback (and with it
+        the websocket reader) returns immediately instead of sitting in the
+        backoff sleep """
+        reconnect_thread = threading.Thread(target=self._delayed_reconnect)
+        reconnect_thread.start()
+
+    def _delayed_reconnect(self):
+
+        """ Back off with jitter before reconnecting, so an outage doesn't turn into a reconnect storm against Noon's servers """
+        delay = min(self.__reconnectDelay, 60) * (0.5 + random.random())
+        self.__reconnectDelay = min(self.__reconnectDelay * 2, 60)
+        _LOGGER.debug("Websocket disconnected. Reconnecting in %.1f seconds...", delay)
+        time.sleep(delay)
+        self.connect()
+
+    def _websocket_message(self, ws, message):
 
-    def _websocket_message(self, message):
-        
         """ Ignore empty messages """
         if message is None or len(message) < 5:
             return
 
         """ Attempt to parse the message """
         try:
-            jsonMessage = json.loads(message)
+            jsonMessage = _json_loads(message)
         except:
-            _LOGGER.debug("Failed to parse message: {}".format(message))
+            _LOGGER.debug("Failed to parse message: %s", message)
             return
 
         """ What sort of message is this? """
-        if isinstance(jsonMessage, Dict):
-
-            """ State change notification """
-            if jsonMessage.get("event", None) == "notification" and isinstance(jsonMessage.get("data"), Dict):
-                data = jsonMessage.get("data")
-                changes = data.get("changes", [])
-                for change in changes:
-                    self._handle_change(change)
-                    
+        if isinstance(jsonMessage, dict):
+
+            """ Dispatch on the event discriminator """
+            handler = self.__eventHandlers.get(jsonMessage.get("event", None), None)
+            data = jsonMessage.get("data", None)
+            if handler is not None and isinstance(data, dict):
+                handler(data)
             else:
-                _LOGGER.error("Unexpected notifiction - {}".format(jsonMessage))
+                _LOGGER.error("Unexpected notification - %s", jsonMessage)
 
         else:
 
-            _LOGGER.error("Invalid notifiction - {}".format(jsonMessage))
-
-
-
-
-def _on_websocket_message(ws, message): 
-
-        ws.parent._websocket_message(message)
-
-def _on_websocket_error(ws, error): 
-
-        _LOGGER.error("Websocket: Error - {}".format(error))
-
-def _on_websocket_close(ws): 
-
-        _LOGGER.error("Websocket: Closed")
-        ws.parent._websocket_disconnected()
-
-def _on_websocket_open(ws): 
-
-        _LOGGER.debug("Websocket: Opened")
-        ws.parent._websocket_connected()
\ No newline at end of file
+            _LOGGER.error("Invalid notification - %s", jsonMessage)
\ No newline at end of file
@@ -12,13 +12,15 @@ setuptools.setup(
     url = 'http://github.com/alistairg/pynoon',
     include_package_data=True,
 	packages=setuptools.find_packages(),
-    install_requires=['requests', 'websocket-client'],
+    python_requires='>=3.9',
+    zip_safe=False,
+    install_requires=['requests>=2.28', 'websocket-client>=1.6', 'orjson'],
     classifiers = [
         'Development Status :: 3 - Alpha',
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3.9',
         'Topic :: Home Automation',
         'Topic :: Software Development :: Libraries :: Python Modules',
     ]